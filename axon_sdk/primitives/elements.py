@@ -10,8 +10,134 @@ Defines core primitives for STICK-based spiking networks:
 
 from .helpers import flatten_nested_list
 
+import math
+import numpy as np
 from typing import Optional
 
+try:
+    from numba import njit
+except ImportError:  # Numba is optional: fall back to the interpreted solver
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+
+def _repeated_sum(x: float, c: float, n: int) -> float:
+    """
+    Compute the result of `n` successive floating-point additions `x += c` without looping over them.
+
+    Within a binade (a range of equal exponent) every addition rounds `c` to the same multiple of the
+    spacing of representable values, so runs of additions can be applied as one exact multiplication.
+    Only the additions crossing a binade boundary, or hitting a rounding tie, are performed one by one.
+    The result is bit-identical to the explicit loop.
+
+    Args:
+        x (float): Starting value.
+        c (float): Increment added at every step.
+        n (int): Number of additions.
+
+    Returns:
+        float: Value of `x` after the `n` additions.
+    """
+    while n > 0:
+        if x + c == x:
+            # Increment is absorbed by rounding; it will be at every later step too
+            return x
+        m = 0
+        if x != 0.0:
+            u = math.ulp(x)
+            q = c / u
+            d = round(q) * u
+            if q - math.floor(q) != 0.5:
+                _, e = math.frexp(abs(x))
+                if x > 0:
+                    lo, hi = 2.0 ** (e - 1) + u, 2.0**e - u
+                else:
+                    lo, hi = -(2.0**e) + u, -(2.0 ** (e - 1)) - u
+                if d > 0 and lo <= x and x + c <= hi:
+                    m = int((hi - c - x) / d) - 1
+                elif d < 0 and x <= hi and lo <= x + c:
+                    m = int((x + c - lo) / -d) - 1
+        m = min(m, n)
+        if m > 0:
+            x += m * d
+            n -= m
+        else:
+            x += c
+            n -= 1
+    return x
+
+
+# Sentinel `limit` values returned by `_spike_step_estimate`
+_NO_SPIKE = -1
+_OSCILLATING = -2
+
+
+@njit(cache=True)
+def _spike_step_estimate(
+    V: float,
+    ge: float,
+    gf: float,
+    gate: float,
+    tm: float,
+    tf: float,
+    Vt: float,
+    dt: float,
+    max_steps: int,
+) -> tuple[float, int]:
+    """
+    Estimate the threshold crossing of a neuron from its scalar state.
+
+    Solved directly while the voltage grows linearly, and with Newton's method on the closed-form
+    trajectory `V(n) = V + A * n + B * (1 - r**n)` while gated. The per-step increment is monotonic,
+    so the trajectory has at most one turning point and Newton's iterates approach the root
+    monotonically from the side of the rising segment. Compiled with Numba when it is installed.
+
+    Returns:
+        tuple[float, int]: Estimated steps until `V >= Vt`, and the last step at which the crossing
+        may happen; the latter is `_NO_SPIKE` or `_OSCILLATING` when no estimate is available.
+    """
+    limit = max_steps
+    if gate == 0:
+        c = dt * ge / tm
+        if c <= 0:
+            return 0.0, _NO_SPIKE
+        return (Vt - V) / c, limit
+
+    r = 1 - dt / tf
+    if not 0.0 < r < 1.0:
+        return 0.0, _OSCILLATING
+
+    A = dt * ge / tm
+    B = gate * gf * tf / tm
+    log_r = math.log(r)
+
+    end = float(max_steps)
+    if B >= 0:
+        # Concave rise; starting left of the root, iterates stay below it
+        if A < 0:
+            if B * log_r >= A:
+                return 0.0, _NO_SPIKE
+            peak = math.log(A / (B * log_r)) / log_r
+            end = min(peak, end)
+            limit = min(max_steps, int(math.floor(peak)) + 1)
+        estimate = 0.0
+    else:
+        # Convex rise after a dip; starting right of the root, iterates stay above it
+        if A <= 0:
+            return 0.0, _NO_SPIKE
+        estimate = min((Vt - V - B) / A, end)
+
+    if V + A * end + B * (1 - math.exp(end * log_r)) < Vt:
+        return 0.0, _NO_SPIKE
+    for _ in range(50):
+        decay = math.exp(estimate * log_r)
+        step = (V + A * estimate + B * (1 - decay) - Vt) / (A - B * log_r * decay)
+        estimate -= step
+        if abs(step) < 1e-9:
+            break
+    return estimate, limit
+
 
 class AbstractNeuron:
     """
@@ -106,6 +232,107 @@ class AbstractNeuron:
             spike = True
         return (self.V, spike)
 
+    def voltage_after(self, steps: int, dt: float) -> float:
+        """
+        Compute the membrane potential reached after `steps` integration steps.
+
+        Equivalent to repeatedly applying `update_and_spike` with no incoming events. While the
+        neuron is not gated, or gated with `gf == 0`, the voltage grows linearly and the result is
+        bit-identical to the step-by-step integration; otherwise `gf` decays geometrically by
+        `(1 - dt / tf)` per step and the closed-form sum is used.
+
+        Args:
+            steps (int): Number of `dt` steps to integrate over.
+            dt (float): Time increment of a single step.
+
+        Returns:
+            float: Voltage after `steps` steps, ignoring the spiking threshold.
+        """
+        if not self.gate or self.gf == 0:
+            return _repeated_sum(
+                self.V, dt * (self.ge + self.gate * self.gf) / self.tm, steps
+            )
+        decay = (1 - dt / self.tf) ** steps
+        return (
+            self.V
+            + steps * dt * self.ge / self.tm
+            + self.gate * self.gf * self.tf / self.tm * (1 - decay)
+        )
+
+    def advance(self, steps: int, dt: float) -> None:
+        """
+        Integrate the neuron state over `steps` steps in a single closed-form update.
+
+        No spike check is performed; callers must make sure the threshold is not
+        crossed within the advanced interval (see `steps_to_spike`).
+
+        Args:
+            steps (int): Number of `dt` steps to integrate over.
+            dt (float): Time increment of a single step.
+        """
+        if steps <= 0:
+            return
+        self.V = self.voltage_after(steps, dt)
+        if self.gate:
+            self.gf *= (1 - dt / self.tf) ** steps
+
+    def steps_to_spike(self, dt: float, max_steps: int) -> Optional[int]:
+        """
+        Predict the number of steps until the neuron spikes in the absence of new events.
+
+        The threshold crossing time is solved analytically by `_spike_step_estimate`, then snapped
+        to the first step where the integrated voltage reaches `Vt`.
+
+        Args:
+            dt (float): Time increment of a single step.
+            max_steps (int): Horizon of the search, in steps.
+
+        Returns:
+            Optional[int]: Steps until `V >= Vt`, or `None` if it does not happen within `max_steps`.
+        """
+        if max_steps < 1:
+            return None
+
+        estimate, limit = _spike_step_estimate(
+            float(self.V),
+            float(self.ge),
+            float(self.gf),
+            float(self.gate),
+            float(self.tm),
+            float(self.tf),
+            float(self.Vt),
+            float(dt),
+            max_steps,
+        )
+        if limit == _OSCILLATING:
+            # Oscillating decay (dt > tf): trajectory is not piecewise monotonic
+            for n in range(1, max_steps + 1):
+                if self.voltage_after(n, dt) >= self.Vt:
+                    return n
+            return None
+        if limit == _NO_SPIKE:
+            return None
+        return self._snap_spike_step(estimate, limit, dt)
+
+    def _snap_spike_step(self, estimate: float, limit: int, dt: float) -> Optional[int]:
+        """
+        Internal method to turn an estimated crossing time into the exact first spiking step.
+
+        Args:
+            estimate (float): Estimated number of steps until `V >= Vt`.
+            limit (int): Last step at which the crossing may happen.
+            dt (float): Time increment of a single step.
+
+        Returns:
+            Optional[int]: First step in `[1, limit]` where `V >= Vt`, or `None`.
+        """
+        n = min(max(1, math.ceil(estimate)), limit + 1)
+        while n > 1 and self.voltage_after(n - 1, dt) >= self.Vt:
+            n -= 1
+        while n <= limit and self.voltage_after(n, dt) < self.Vt:
+            n += 1
+        return n if n <= limit else None
+
     def receive_synaptic_event(self, synapse_type, weight):
         """
         Apply a synaptic event to update internal state variables.
@@ -136,6 +363,10 @@ class ExplicitNeuron(AbstractNeuron):
     Attributes:
         spike_times (list[float]): Timestamps of all emitted spikes.
         out_synapses (list[Synapse]): Outgoing synapses from this neuron.
+        syn_delay (tuple[float, ...]): Delay of each outgoing synapse.
+        syn_weight (tuple[float, ...]): Weight of each outgoing synapse.
+        syn_type (tuple[str, ...]): Type of each outgoing synapse.
+        syn_post (tuple[ExplicitNeuron, ...]): Target of each outgoing synapse.
     """
     def __init__(
         self,
@@ -162,6 +393,67 @@ class ExplicitNeuron(AbstractNeuron):
         super().__init__(Vt, tm, tf, Vreset, neuron_name, parent_mod_id, additional_info)
         self.spike_times: list[float] = []
         self.out_synapses: list[Synapse] = []
+        self._synapse_arrays: tuple[tuple, tuple, tuple, tuple] = ((), (), (), ())
+        self._num_finalized = 0
+
+    def finalize(self) -> None:
+        """
+        Freeze `out_synapses` into parallel tuples of delays, weights, types and targets.
+
+        Spike propagation reads these instead of walking the attributes of every `Synapse`.
+        `synapse_arrays` calls this lazily whenever synapses were added or removed since the
+        last freeze; call it explicitly after modifying an existing `Synapse` in place.
+        """
+        synapses = self.out_synapses
+        self._synapse_arrays = (
+            tuple(synapse.delay for synapse in synapses),
+            tuple(synapse.weight for synapse in synapses),
+            tuple(synapse.type for synapse in synapses),
+            tuple(synapse.post_neuron for synapse in synapses),
+        )
+        self._num_finalized = len(synapses)
+
+    def synapse_arrays(self) -> tuple[tuple, tuple, tuple, tuple]:
+        """
+        Returns:
+            tuple[tuple, tuple, tuple, tuple]: Delays, weights, types and targets of the outgoing
+            synapses, re-frozen first if `out_synapses` changed length since the last `finalize`.
+        """
+        if len(self.out_synapses) != self._num_finalized:
+            self.finalize()
+        return self._synapse_arrays
+
+    @property
+    def syn_delay(self) -> tuple[float, ...]:
+        """
+        Returns:
+            tuple[float, ...]: Delay of each outgoing synapse.
+        """
+        return self.synapse_arrays()[0]
+
+    @property
+    def syn_weight(self) -> tuple[float, ...]:
+        """
+        Returns:
+            tuple[float, ...]: Weight of each outgoing synapse.
+        """
+        return self.synapse_arrays()[1]
+
+    @property
+    def syn_type(self) -> tuple[str, ...]:
+        """
+        Returns:
+            tuple[str, ...]: Type of each outgoing synapse.
+        """
+        return self.synapse_arrays()[2]
+
+    @property
+    def syn_post(self) -> tuple["ExplicitNeuron", ...]:
+        """
+        Returns:
+            tuple[ExplicitNeuron, ...]: Target of each outgoing synapse.
+        """
+        return self.synapse_arrays()[3]
 
     def reset(self):
         """
@@ -221,3 +513,84 @@ class Synapse:
             str: Unique identifier for this synapse.
         """
         return self._uid
+
+
+# Below this batch size the per-neuron scalar solver is faster than gathering arrays
+BATCH_PREDICTION_MIN_SIZE = 48
+
+
+def predict_spike_steps(
+    neurons: list[AbstractNeuron], dt: float, max_steps: int
+) -> list[Optional[int]]:
+    """
+    Predict the spiking step of several neurons at once.
+
+    Vectorized counterpart of `AbstractNeuron.steps_to_spike`: the neuron states are gathered into
+    arrays and the crossing times are solved with a single NumPy Newton iteration for the whole batch.
+    Each estimate is then snapped to the exact spiking step per neuron, so results are identical
+    to the scalar solver.
+
+    Args:
+        neurons (list[AbstractNeuron]): Neurons to predict, in no particular order.
+        dt (float): Time increment of a single step.
+        max_steps (int): Horizon of the search, in steps.
+
+    Returns:
+        list[Optional[int]]: Steps until each neuron spikes, or `None` if it does not within `max_steps`.
+    """
+    if len(neurons) < BATCH_PREDICTION_MIN_SIZE or max_steps < 1:
+        return [neuron.steps_to_spike(dt, max_steps) for neuron in neurons]
+
+    V = np.array([n.V for n in neurons], dtype=np.float64)
+    ge = np.array([n.ge for n in neurons], dtype=np.float64)
+    gf = np.array([n.gf for n in neurons], dtype=np.float64)
+    gate = np.array([n.gate for n in neurons], dtype=np.float64)
+    tm = np.array([n.tm for n in neurons], dtype=np.float64)
+    tf = np.array([n.tf for n in neurons], dtype=np.float64)
+    Vt = np.array([n.Vt for n in neurons], dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore", over="ignore"):
+        gated = gate != 0
+        r = 1 - dt / tf
+        oscillating = gated & ~((r > 0) & (r < 1))
+        log_r = np.log(np.where(gated & ~oscillating, r, 0.5))
+
+        # V(n) = V + A * n + B * (1 - r**n), with B = 0 while not gated
+        A = dt * ge / tm
+        B = np.where(gated, gate * gf * tf / tm, 0.0)
+
+        concave = B >= 0
+        falling = concave & (A < 0)
+        peak = np.where(falling, np.log(A / (B * log_r)) / log_r, np.inf)
+        end = np.minimum(peak, max_steps)
+        limit = np.where(falling, np.minimum(max_steps, np.floor(peak) + 1), max_steps)
+        rising = np.where(concave, ~falling | (B * log_r < A), A > 0)
+        estimate = np.where(concave, 0.0, np.minimum((Vt - V - B) / A, max_steps))
+
+        def f(n):
+            return V + A * n + B * (1 - np.exp(n * log_r)) - Vt
+
+        def df(n):
+            return A - B * log_r * np.exp(n * log_r)
+
+        valid = rising & (gated | (A > 0)) & (f(end) >= 0)
+        active = valid & gated
+        for _ in range(50):
+            step = np.where(active, f(estimate) / df(estimate), 0.0)
+            estimate -= step
+            active &= np.abs(step) >= 1e-9
+            if not active.any():
+                break
+
+        # Linear phase: the crossing is the closed-form root
+        estimate = np.where(gated, estimate, (Vt - V) / A)
+
+    results: list[Optional[int]] = []
+    for i, neuron in enumerate(neurons):
+        if oscillating[i]:
+            results.append(neuron.steps_to_spike(dt, max_steps))
+        elif valid[i]:
+            results.append(neuron._snap_spike_step(estimate[i], int(limit[i]), dt))
+        else:
+            results.append(None)
+    return results
@@ -7,9 +7,14 @@ Defines event queue infrastructure for managing timed spike events in STICK-base
 Classes:
     - SpikeEvent: Represents a scheduled synaptic event.
     - SpikeEventQueue: Priority queue for time-ordered spike events.
+    - SpikePredictionQueue: Priority queue of cancelable predicted spikes, keyed by simulation step.
 """
 
 import heapq
+import math
+from collections import deque
+from typing import Optional, Sequence
+
 from axon_sdk.primitives import ExplicitNeuron
 
 
@@ -23,6 +28,8 @@ class SpikeEvent:
             synapse_type (str): Type of synaptic interaction (e.g., 'ge', 'gf', 'gate', 'V').
             weight (float): Synaptic weight to apply during the event.
     """
+    __slots__ = ("time", "affected_neuron", "synapse_type", "weight")
+
     def __init__(
         self,
         time: float,
@@ -54,21 +61,68 @@ class SpikeEvent:
         Returns:
             bool: True if this event occurs earlier than `other`.
         """
-        # Needed since spike events will be used in a heap
+        # Queue entries are ordered by (time, seq) first; this only serves direct comparisons
         return self.time < other.time
 
 
+def time_to_step(time: float, dt: float) -> int:
+    """
+    Index of the simulation step at which an event scheduled at `time` is applied.
+
+    Step `i` covers the interval ending at `(i + 1) * dt`; an event is applied at the first step
+    whose end time is not earlier than the event time.
+
+    Args:
+        time (float): Scheduled event time.
+        dt (float): Simulation timestep.
+
+    Returns:
+        int: Step index, at least 0.
+    """
+    step = max(0, math.ceil(time / dt) - 1)
+    # Correct for rounding in `time / dt` so the result matches the `(i + 1) * dt >= time` comparison
+    while (step + 1) * dt < time:
+        step += 1
+    while step > 0 and step * dt >= time:
+        step -= 1
+    return step
+
+
 class SpikeEventQueue:
     """
     Priority queue for managing time-sorted spike events.
 
-    Implements event insertion and retrieval of events scheduled up to the current simulation time.
+    Events are stored as `(step, time, seq, event)` entries. The integer step at which an event is
+    applied is computed once on insertion, so the simulator schedules and compares steps exactly;
+    the monotonic `seq` counter breaks ties between simultaneous events deterministically, in
+    insertion order.
+
+    STICK networks use a small set of discrete synaptic delays, and spikes are emitted in time order
+    during a simulation. Events added with their `delay` therefore go to one FIFO per delay value,
+    which stays sorted by construction (a calendar queue): insertion is O(1) and only the bucket heads
+    are kept in a heap. Events without a delay, or arriving out of order for their bucket, fall back
+    to a regular binary heap.
     """
-    def __init__(self):
+    def __init__(self, dt: float = 0.001):
         """
         Initialize an empty spike event queue.
+
+        Args:
+            dt (float, optional): Simulation timestep used to assign events to steps. Defaults to 1 ms.
+        """
+        self.dt = dt
+        self._heap: list[tuple[int, float, int, SpikeEvent]] = []
+        self._buckets: dict[float, deque[tuple[int, float, int, SpikeEvent]]] = {}
+        self._bucket_heads: list[tuple[int, float, int, float]] = []
+        self._seq = 0
+        self._size = 0
+
+    def __len__(self) -> int:
         """
-        self.events: list[SpikeEvent] = []
+        Returns:
+            int: Number of events still pending in the queue.
+        """
+        return self._size
 
     def add_event(
         self,
@@ -76,6 +130,7 @@ class SpikeEventQueue:
         neuron: ExplicitNeuron,
         synapse_type: str,
         weight: float,
+        delay: Optional[float] = None,
     ):
         """
         Add a new spike event to the queue.
@@ -85,14 +140,111 @@ class SpikeEventQueue:
             neuron (ExplicitNeuron): Target neuron.
             synapse_type (str): Synapse type.
             weight (float): Weight of the synaptic input.
+            delay (float, optional): Synaptic delay that produced the event, used to select its FIFO.
         """
-        event = SpikeEvent(
-            time=time,
-            affected_neuron=neuron,
-            synapse_type=synapse_type,
-            weight=weight,
+        self.add_events(
+            [time],
+            [neuron],
+            [synapse_type],
+            [weight],
+            delays=None if delay is None else [delay],
         )
-        heapq.heappush(self.events, event)
+
+    def add_events(
+        self,
+        times: Sequence[float],
+        neurons: Sequence[ExplicitNeuron],
+        synapse_types: Sequence[str],
+        weights: Sequence[float],
+        delays: Optional[Sequence[float]] = None,
+    ):
+        """
+        Add a batch of spike events to the queue, given as parallel sequences.
+
+        Equivalent to calling `add_event` for each position in order, without the per-call overhead.
+        Into an empty heap, events without delays are inserted with a single `heapify`.
+
+        Args:
+            times (Sequence[float]): Scheduled time of each event.
+            neurons (Sequence[ExplicitNeuron]): Target neuron of each event.
+            synapse_types (Sequence[str]): Synapse type of each event.
+            weights (Sequence[float]): Weight of each synaptic input.
+            delays (Sequence[float], optional): Synaptic delay of each event, used to select its FIFO.
+        """
+        seq = self._seq
+        dt = self.dt
+        entries = [
+            (
+                time_to_step(time, dt),
+                time,
+                seq + i,
+                SpikeEvent(time, neuron, synapse_type, weight),
+            )
+            for i, (time, neuron, synapse_type, weight) in enumerate(
+                zip(times, neurons, synapse_types, weights)
+            )
+        ]
+        self._seq += len(entries)
+        self._size += len(entries)
+
+        heap = self._heap
+        if delays is None:
+            if heap:
+                for entry in entries:
+                    heapq.heappush(heap, entry)
+            else:
+                heap.extend(entries)
+                heapq.heapify(heap)
+            return
+
+        buckets = self._buckets
+        for entry, delay in zip(entries, delays):
+            bucket = buckets.get(delay)
+            if bucket is None:
+                bucket = buckets[delay] = deque()
+            if not bucket:
+                bucket.append(entry)
+                heapq.heappush(self._bucket_heads, (*entry[:3], delay))
+            elif entry[1] >= bucket[-1][1]:
+                bucket.append(entry)
+            else:
+                heapq.heappush(heap, entry)
+
+    def peek_step(self) -> int:
+        """
+        Step at which the earliest pending event is applied.
+
+        Returns:
+            int: Step index of the next event to be popped.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        return self._peek()[0]
+
+    def peek_time(self) -> float:
+        """
+        Time of the earliest pending event.
+
+        Returns:
+            float: Scheduled time of the next event to be popped.
+
+        Raises:
+            IndexError: If the queue is empty.
+        """
+        return self._peek()[1]
+
+    def pop_step(self, step: int) -> list[SpikeEvent]:
+        """
+        Pop all events applied up to a given simulation step.
+
+        Args:
+            step (int): The current simulation step.
+
+        Returns:
+            List[SpikeEvent]: List of events to apply at this timestep, in time order.
+        """
+        return self._pop_until(0, step)
 
     def pop_events(self, current_time) -> list[SpikeEvent]:
         """
@@ -104,7 +256,130 @@ class SpikeEventQueue:
         Returns:
             List[SpikeEvent]: List of events to apply at this timestep.
         """
+        return self._pop_until(1, current_time)
+
+    def _peek(self) -> tuple:
+        """
+        Internal method returning the `(step, time, seq, ...)` key of the earliest pending event.
+        """
+        if self._bucket_heads and (
+            not self._heap or self._bucket_heads[0][:3] < self._heap[0][:3]
+        ):
+            return self._bucket_heads[0]
+        return self._heap[0]
+
+    def _pop_until(self, key: int, bound: float) -> list[SpikeEvent]:
+        """
+        Internal method popping events in order while their `key` field (0: step, 1: time) is <= `bound`.
+        """
         events = []
-        while self.events and self.events[0].time <= current_time:
-            events.append(heapq.heappop(self.events))
+        heap = self._heap
+        heads = self._bucket_heads
+        while True:
+            if heads and (not heap or heads[0][:3] < heap[0][:3]):
+                if heads[0][key] > bound:
+                    break
+                delay = heapq.heappop(heads)[3]
+                bucket = self._buckets[delay]
+                events.append(bucket.popleft()[3])
+                if bucket:
+                    heapq.heappush(heads, (*bucket[0][:3], delay))
+            elif heap and heap[0][key] <= bound:
+                events.append(heapq.heappop(heap)[3])
+            else:
+                break
+        self._size -= len(events)
         return events
+
+
+class SpikePredictionQueue:
+    """
+    Priority queue of predicted neuron spikes, keyed by simulation step.
+
+    Each neuron holds at most one live prediction. Cancelling or replacing a prediction is O(1):
+    the neuron's entry is forgotten and its heap entry becomes a tombstone, skipped when it reaches
+    the top of the heap. The heap is rebuilt from the live entries whenever tombstones outnumber them.
+    """
+    # Heaps below this size are never compacted
+    MIN_COMPACTION_SIZE = 64
+
+    def __init__(self):
+        """
+        Initialize an empty prediction queue.
+        """
+        self._heap: list[tuple[int, int, ExplicitNeuron]] = []
+        self._live: dict[ExplicitNeuron, tuple[int, int]] = {}
+        self._seq = 0
+
+    def __len__(self) -> int:
+        """
+        Returns:
+            int: Number of live predictions.
+        """
+        return len(self._live)
+
+    def schedule(self, neuron: ExplicitNeuron, step: int) -> None:
+        """
+        Predict that a neuron spikes at a given step, replacing any previous prediction for it.
+
+        Args:
+            neuron (ExplicitNeuron): Neuron expected to spike.
+            step (int): Simulation step of the spike.
+        """
+        self._live[neuron] = (step, self._seq)
+        heapq.heappush(self._heap, (step, self._seq, neuron))
+        self._seq += 1
+        if (
+            len(self._heap) > self.MIN_COMPACTION_SIZE
+            and len(self._heap) > 2 * len(self._live)
+        ):
+            self._heap = [(s, q, n) for n, (s, q) in self._live.items()]
+            heapq.heapify(self._heap)
+
+    def cancel(self, neuron: ExplicitNeuron) -> None:
+        """
+        Drop the prediction of a neuron, if any.
+
+        Args:
+            neuron (ExplicitNeuron): Neuron whose prediction is no longer valid.
+        """
+        self._live.pop(neuron, None)
+
+    def peek_step(self) -> int:
+        """
+        Step of the earliest live prediction.
+
+        Returns:
+            int: Simulation step of the next predicted spike.
+
+        Raises:
+            IndexError: If there are no live predictions.
+        """
+        self._drop_tombstones()
+        return self._heap[0][0]
+
+    def pop_due(self, step: int) -> list[ExplicitNeuron]:
+        """
+        Pop the neurons predicted to spike up to a given step.
+
+        Args:
+            step (int): Current simulation step.
+
+        Returns:
+            list[ExplicitNeuron]: Neurons whose live prediction is due, in prediction order.
+        """
+        neurons = []
+        self._drop_tombstones()
+        while self._heap and self._heap[0][0] <= step:
+            _, _, neuron = heapq.heappop(self._heap)
+            del self._live[neuron]
+            neurons.append(neuron)
+            self._drop_tombstones()
+        return neurons
+
+    def _drop_tombstones(self) -> None:
+        """
+        Internal method to discard cancelled or replaced entries from the top of the heap.
+        """
+        while self._heap and self._live.get(self._heap[0][2]) != self._heap[0][:2]:
+            heapq.heappop(self._heap)
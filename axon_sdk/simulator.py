@@ -11,7 +11,8 @@ Key components:
 - `count_spikes`: utility to count total emitted spikes in a simulation.
 
 The simulator works in discrete time with configurable timestep `dt`, executing all synaptic and neuron dynamics via
-event-based updates and logging internal state.
+event-based updates and logging internal state. Only timesteps at which a synaptic event arrives or a neuron is
+predicted to spike are visited; in between, neuron state is advanced in closed form.
 """
 
 from axon_sdk.primitives import (
@@ -22,13 +23,55 @@ from axon_sdk.compilation import ExecutionPlan
 from axon_sdk.primitives import ExplicitNeuron
 
 from .visualization.chronogram import plot_chronogram
-from .visualization.topovis import vis_topology
+from .visualization.topovis import vis_topology, build_graph_data
+from .visualization.artifact import dump_artifact
 from .compilation.compiler import OutputReader
-from .primitives.events import SpikeEventQueue
+from .primitives.events import SpikeEventQueue, SpikePredictionQueue
+from .primitives.elements import predict_spike_steps
 
 import os
+import subprocess
+import sys
+import tempfile
+import numpy as np
+from array import array
+from functools import partial
 
-from typing import Self, Optional
+from typing import Any, Callable, Self, Optional
+
+
+class _NeuronLog(dict):
+    """
+    Neuron-keyed log whose entries are shared with a UID-keyed dictionary.
+
+    Records are appended through the neuron key, which hashes by identity instead of
+    going through the `uid` property. A neuron's entry is created on first access and
+    registered under its UID at the same time, so the UID-keyed dictionary always
+    holds the very same list or array objects.
+    """
+
+    def __init__(self, factory: Callable[[], Any], by_uid: dict) -> None:
+        super().__init__()
+        self._factory = factory
+        self._by_uid = by_uid
+
+    def register(self, neuron: ExplicitNeuron) -> Any:
+        """
+        Create the entry of a neuron, reusing the one stored under its UID if present.
+
+        Args:
+            neuron (ExplicitNeuron): Neuron to register.
+
+        Returns:
+            Any: The neuron's log entry.
+        """
+        entry = self._by_uid.get(neuron.uid)
+        if entry is None:
+            entry = self._by_uid[neuron.uid] = self._factory()
+        self[neuron] = entry
+        return entry
+
+    __missing__ = register
 
 
 class Simulator:
@@ -39,8 +82,8 @@ class Simulator:
         net (SpikingNetworkModule): The spiking neural network to simulate.
         encoder (DataEncoder): Object for converting values to spike intervals and back.
         dt (float): Simulation time resolution in seconds.
-        spike_log (dict[str, list[float]]): Records spike times per neuron UID.
-        voltage_log (dict[str, list[tuple]]): Records membrane voltages over time.
+        spike_log (dict[str, array]): Records spike times per neuron UID, as typed `array("d")` buffers.
+        voltage_log (dict[str, list[tuple]]): Records `(V, step)` samples at the timesteps each neuron is visited.
         event_queue (SpikeEventQueue): Queue of scheduled synaptic events.
     """
 
@@ -56,15 +99,28 @@ class Simulator:
             dt (float, optional): Simulation timestep. Defaults to 1 ms.
         """
         self.net = net
-        self.event_queue = SpikeEventQueue()
+        self.event_queue = SpikeEventQueue(dt=dt)
         self.encoder = encoder
         self.dt = dt
-        self.timesteps: list[float] = []
-        self.spike_log: dict[str, list[float]] = {}
+        self._num_steps = 0
+        # Spike times are stored as raw doubles rather than lists of boxed floats; each `array("d")`
+        # can be viewed as a NumPy array without copying through `np.frombuffer`
+        self.spike_log: dict[str, array] = {}
         self.voltage_log: dict[str, list[tuple]] = {}
+        # Records go through neuron-keyed views sharing their entries with the logs above
+        self._spike_times = _NeuronLog(partial(array, "d"), self.spike_log)
+        self._voltages = _NeuronLog(list, self.voltage_log)
         for neuron in self.net.neurons:
-            self.spike_log[neuron.uid] = []
-            self.voltage_log[neuron.uid] = []
+            self._spike_times.register(neuron)
+            self._voltages.register(neuron)
+
+    @property
+    def timesteps(self) -> np.ndarray:
+        """
+        Returns:
+            np.ndarray: End time of every step covered by the last call to `simulate`.
+        """
+        return np.arange(1, self._num_steps + 1) * self.dt
 
     @classmethod
     def init_with_plan(
@@ -102,16 +158,22 @@ class Simulator:
         assert value >= 0.0 and value <= 1.0
 
         spike_interval = self.encoder.encode_value(value)
-        for t_spike_in_interval in spike_interval:
-            event_time = t0 + t_spike_in_interval
+        event_times = [t0 + t_spike_in_interval for t_spike_in_interval in spike_interval]
+        for event_time in event_times:
             self._log_spike_occurrence(neuron=neuron, t=event_time)
-            for synapse in neuron.out_synapses:
-                self.event_queue.add_event(
-                    time=event_time + synapse.delay,
-                    neuron=synapse.post_neuron,
-                    synapse_type=synapse.type,
-                    weight=synapse.weight,
-                )
+
+        # One batch with every (spike, synapse) pair, spike-major
+        delays, weights, types, posts = neuron.synapse_arrays()
+        self.event_queue.add_events(
+            times=[
+                event_time + delay
+                for event_time in event_times
+                for delay in delays
+            ],
+            neurons=posts * len(event_times),
+            synapse_types=types * len(event_times),
+            weights=weights * len(event_times),
+        )
 
     def apply_input_spike(self, neuron: ExplicitNeuron, t: float):
         """
@@ -122,18 +184,21 @@ class Simulator:
             t (float): Time at which spike occurs.
         """
         self._log_spike_occurrence(neuron, t)
-        for synapse in neuron.out_synapses:
-            self.event_queue.add_event(
-                time=t + synapse.delay,
-                neuron=synapse.post_neuron,
-                synapse_type=synapse.type,
-                weight=synapse.weight,
-            )
+        delays, weights, types, posts = neuron.synapse_arrays()
+        self.event_queue.add_events(
+            times=[t + delay for delay in delays],
+            neurons=posts,
+            synapse_types=types,
+            weights=weights,
+        )
 
     def simulate(self, simulation_time: float):
         """
         Run the network simulation for a given total duration.
 
+        The loop jumps directly between timesteps where something happens: steps at which queued
+        synaptic events are due, and steps at which an active neuron is predicted to cross its threshold.
+
         Args:
             simulation_time (float): Total simulation duration in seconds.
 
@@ -141,51 +206,99 @@ class Simulator:
             - Spike times in `self.spike_log`
             - Voltage traces in `self.voltage_log`
         """
-        num_steps = int(simulation_time / self.dt)
-        self.timesteps = [(i + 1) * self.dt for i in range(num_steps)]
-        # Set to track neurons with non-zero ge, gf, or gate at the end of a timestep
-        active_state_neurons: set[ExplicitNeuron] = set()
-
-        for i, t in enumerate(self.timesteps):
-            events = self.event_queue.pop_events(t)
-
-            currently_affected_neurons = set()
-            for event in events:
+        self._num_steps = int(simulation_time / self.dt)
+        last_step = self._num_steps - 1
+
+        # Step at which each visited neuron's state was last integrated
+        neuron_steps: dict[ExplicitNeuron, int] = {}
+        # Upcoming threshold crossings of internally active neurons
+        predictions = SpikePredictionQueue()
+
+        step = -1
+        while True:
+            next_step = last_step + 1
+            if self.event_queue:
+                # Events due at an already simulated step are applied at the next one
+                next_step = max(step + 1, self.event_queue.peek_step())
+            if predictions:
+                next_step = min(next_step, predictions.peek_step())
+            if next_step > last_step:
+                break
+
+            step = next_step
+            t = (step + 1) * self.dt
+
+            # Neurons visited in this step, advanced to the end of the previous step
+            neurons_to_simulate: dict[ExplicitNeuron, None] = {}
+            for event in self.event_queue.pop_step(step):
+                neuron = event.affected_neuron
+                if neuron not in neurons_to_simulate:
+                    self._advance_neuron(neuron, neuron_steps.get(neuron, step - 1), step - 1)
+                    neurons_to_simulate[neuron] = None
                 # Apply synaptic event, modifying the neuron's V, ge, gf, or gate
-                event.affected_neuron.receive_synaptic_event(
-                    event.synapse_type, event.weight
-                )
-                currently_affected_neurons.add(event.affected_neuron)
+                neuron.receive_synaptic_event(event.synapse_type, event.weight)
 
-            # Collect all neurons that should be simulated
-            neurons_to_simulate = currently_affected_neurons.union(active_state_neurons)
-            # Prepare a set to hold the neurons turning active after this `dt`
-            newly_active_state_neurons = set()
+            for neuron in predictions.pop_due(step):
+                if neuron not in neurons_to_simulate:
+                    self._advance_neuron(neuron, neuron_steps[neuron], step - 1)
+                    neurons_to_simulate[neuron] = None
 
+            still_active: list[ExplicitNeuron] = []
             for neuron in neurons_to_simulate:
+                predictions.cancel(neuron)
                 (V_after_update, spike) = neuron.update_and_spike(self.dt)
+                neuron_steps[neuron] = step
                 # neuron.V is now V_after_update
-                self._log_voltage_value(neuron=neuron, V=neuron.V, timestep=i)
+                self._log_voltage_value(neuron=neuron, V=neuron.V, timestep=step)
 
                 if spike:
                     self._log_spike_occurrence(neuron=neuron, t=t)
                     neuron.reset()  # V becomes Vreset, ge=0, gf=0, gate=0
-                    for synapse in neuron.out_synapses:
-                        self.event_queue.add_event(
-                            time=t + synapse.delay,
-                            neuron=synapse.post_neuron,
-                            synapse_type=synapse.type,
-                            weight=synapse.weight,
-                        )
+                    self._log_voltage_value(neuron=neuron, V=neuron.V, timestep=step)
+                    delays, weights, types, posts = neuron.synapse_arrays()
+                    self.event_queue.add_events(
+                        times=[t + delay for delay in delays],
+                        neurons=posts,
+                        synapse_types=types,
+                        weights=weights,
+                        delays=delays,
+                    )
+                elif neuron.ge != 0.0 or neuron.gf != 0.0 or neuron.gate != 0:
+                    still_active.append(neuron)
+
+            # Neurons remaining internally active: schedule their next threshold crossing
+            spike_steps = predict_spike_steps(still_active, self.dt, last_step - step)
+            for neuron, n in zip(still_active, spike_steps):
+                if n is not None:
+                    predictions.schedule(neuron, step + n)
+
+        # Bring every visited neuron up to the end of the simulated interval
+        for neuron, neuron_step in neuron_steps.items():
+            self._advance_neuron(neuron, neuron_step, last_step)
+
+        vis = os.getenv("VIS", "0")
+        if vis == "1":
+            self.launch_visualization()
+        elif vis == "async":
+            self.launch_visualization_async()
 
-                # After update and potential reset, check if it remains internally active for the next step
-                if neuron.ge != 0.0 or neuron.gf != 0.0 or neuron.gate != 0:
-                    newly_active_state_neurons.add(neuron)
+    def _advance_neuron(
+        self, neuron: ExplicitNeuron, from_step: int, to_step: int
+    ) -> None:
+        """
+        Internal method to bring a neuron from the end of `from_step` to the end of `to_step`.
 
-            active_state_neurons = newly_active_state_neurons
+        The voltage reached is logged, so that voltage traces can be drawn by interpolating
+        between the logged samples instead of storing every timestep.
 
-        if os.getenv("VIS", "0") == "1":
-            self.launch_visualization()
+        Args:
+            neuron (ExplicitNeuron): Neuron to advance.
+            from_step (int): Step at which the neuron state was last integrated.
+            to_step (int): Step to integrate up to.
+        """
+        if to_step > from_step:
+            neuron.advance(to_step - from_step, self.dt)
+            self._log_voltage_value(neuron=neuron, V=neuron.V, timestep=to_step)
 
     def _log_spike_occurrence(self, neuron: ExplicitNeuron, t: float) -> None:
         """
@@ -195,10 +308,7 @@ class Simulator:
             neuron (ExplicitNeuron): Neuron that spiked.
             t (float): Time of spike event.
         """
-        if neuron.uid in self.spike_log:
-            self.spike_log[neuron.uid].append(t)
-        else:
-            self.spike_log[neuron.uid] = [t]
+        self._spike_times[neuron].append(t)
 
     def _log_voltage_value(
         self, neuron: ExplicitNeuron, V: float, timestep: float
@@ -211,7 +321,7 @@ class Simulator:
             V (float): Membrane voltage.
             timestep (float): Simulation step index.
         """
-        self.voltage_log[neuron.uid].append((V, timestep))
+        self._voltages[neuron].append((V, timestep))
 
     def launch_visualization(self):
         """
@@ -226,6 +336,51 @@ class Simulator:
             spike_log=self.spike_log,
         )
 
+    def launch_visualization_async(
+        self, path: Optional[str] = None
+    ) -> subprocess.Popen:
+        """
+        Launch the visualizations in a separate process, without blocking the caller.
+
+        The simulation logs are dumped to an artifact file that the spawned
+        `python -m axon_sdk.visualization` process renders. The artifact is kept, so the
+        visualization can be reopened later with `axon-viz <path>`.
+
+        Requires `VIS=async` in environment variables when called from `simulate`.
+
+        Args:
+            path (Optional[str]): Artifact destination. A temporary `.npz` file is used if omitted.
+
+        Returns:
+            subprocess.Popen: Handle to the visualization process.
+        """
+        if path is None:
+            fd, path = tempfile.mkstemp(prefix="axon_vis_", suffix=".npz")
+            os.close(fd)
+        self._dump_viz_artifact(path)
+        print(f"Visualization artifact written to {path}")
+        return subprocess.Popen(
+            [sys.executable, "-m", "axon_sdk.visualization", path],
+            stdout=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+    def _dump_viz_artifact(self, path: str) -> None:
+        """
+        Internal method to write the logs and network topology to a visualization artifact.
+
+        Args:
+            path (str): Artifact destination.
+        """
+        dump_artifact(
+            path,
+            dt=self.dt,
+            num_steps=self._num_steps,
+            voltage_log=self.voltage_log,
+            spike_log=self.spike_log,
+            graph_data=build_graph_data(self.net),
+        )
+
 
 def decode_output(sim: Simulator, reader: OutputReader) -> Optional[float]:
     """
@@ -0,0 +1,29 @@
+"""
+Render the visualizations stored in an artifact written by the simulator.
+
+Usage:
+    python -m axon_sdk.visualization <artifact.npz>
+"""
+
+import argparse
+
+from .artifact import load_artifact
+from .chronogram import plot_chronogram
+from .server import start_server
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="axon-viz",
+        description="Render the topology and chronogram of a saved simulation.",
+    )
+    parser.add_argument("path", help="Visualization artifact (.npz) written by the simulator")
+    args = parser.parse_args()
+
+    timesteps, voltage_log, spike_log, graph_data = load_artifact(args.path)
+    start_server(graph_data)
+    plot_chronogram(timesteps=timesteps, voltage_log=voltage_log, spike_log=spike_log)
+
+
+if __name__ == "__main__":
+    main()
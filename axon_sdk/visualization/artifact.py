@@ -0,0 +1,92 @@
+"""
+Visualization Artifacts
+=======================
+
+Stores everything needed to visualize a finished simulation in a single compressed `.npz` file, so that
+visualizations can be rendered by a separate process (`python -m axon_sdk.visualization <path>`, or the
+`axon-viz` command) while the simulating process moves on.
+
+Logs are flattened into a few contiguous arrays, one offset array per log marking where each neuron's
+entries start, instead of one Python list per neuron.
+"""
+
+import json
+from array import array
+
+import numpy as np
+
+
+def dump_artifact(
+    path: str,
+    dt: float,
+    num_steps: int,
+    voltage_log: dict[str, list[tuple]],
+    spike_log: dict[str, array],
+    graph_data: dict[str, list],
+) -> None:
+    """
+    Write simulation logs and topology data to a compressed `.npz` file.
+
+    Args:
+        path (str): Destination file.
+        dt (float): Simulation timestep.
+        num_steps (int): Number of simulated steps.
+        voltage_log (dict[str, list[tuple]]): `(V, step)` voltage samples per neuron UID.
+        spike_log (dict[str, array]): Spike times per neuron UID.
+        graph_data (dict[str, list]): Topology data, as built by `build_graph_data`.
+    """
+    # Neurons outside the network driven only by input spikes have no voltage samples
+    uids = list(dict.fromkeys([*voltage_log, *spike_log]))
+    samples = [voltage_log.get(uid, []) for uid in uids]
+    spikes = [spike_log.get(uid, array("d")) for uid in uids]
+    num_samples = sum(len(s) for s in samples)
+
+    np.savez_compressed(
+        path,
+        dt=dt,
+        num_steps=num_steps,
+        uids=np.array(uids, dtype=str),
+        voltage_offsets=np.cumsum([0] + [len(s) for s in samples]),
+        voltage_values=np.fromiter(
+            (V for s in samples for V, _ in s), dtype=np.float32, count=num_samples
+        ),
+        voltage_steps=np.fromiter(
+            (step for s in samples for _, step in s), dtype=np.int64, count=num_samples
+        ),
+        spike_offsets=np.cumsum([0] + [len(s) for s in spikes]),
+        spike_times=np.concatenate(
+            [np.frombuffer(s, dtype=np.float64) for s in spikes] or [np.empty(0)]
+        ),
+        graph_data=json.dumps(graph_data),
+    )
+
+
+def load_artifact(
+    path: str,
+) -> tuple[np.ndarray, dict[str, list[tuple]], dict[str, array], dict[str, list]]:
+    """
+    Read an artifact written by `dump_artifact`.
+
+    Args:
+        path (str): Artifact file.
+
+    Returns:
+        tuple: `(timesteps, voltage_log, spike_log, graph_data)`, in the formats taken by
+        `plot_chronogram` and `start_server`.
+    """
+    with np.load(path) as data:
+        timesteps = np.arange(1, int(data["num_steps"]) + 1) * float(data["dt"])
+        uids = data["uids"].tolist()
+        v_off = data["voltage_offsets"]
+        values = data["voltage_values"].tolist()
+        steps = data["voltage_steps"].tolist()
+        s_off = data["spike_offsets"]
+        times = data["spike_times"]
+        graph_data = json.loads(str(data["graph_data"]))
+
+    voltage_log = {}
+    spike_log = {}
+    for i, uid in enumerate(uids):
+        voltage_log[uid] = list(zip(values[v_off[i] : v_off[i + 1]], steps[v_off[i] : v_off[i + 1]]))
+        spike_log[uid] = array("d", times[s_off[i] : s_off[i + 1]].tobytes())
+    return timesteps, voltage_log, spike_log, graph_data
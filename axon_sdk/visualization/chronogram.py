@@ -1,60 +1,28 @@
 import matplotlib.pyplot as plt
+import numpy as np
+from array import array
 from matplotlib.pyplot import cm
 
 
-def build_array(length, entry_points, fill_method="ffil"):
-    """
-    Build an array of specified length using the provided entry points.
-
-    Args:
-        length (int): Desired length of the output array
-        entry_points (list): List of tuples (x, t) where x is a value and t is an index
-        fill_method (str): Method to fill missing values. Options are 'zero' or 'ffill' (forward fill)
-
-    Returns:
-        list: An array of the specified length with values at entry points and filled values elsewhere
-    """
-    # Initialize array with zeros
-    result = [0] * length
-
-    # Sort entry points by index
-    sorted_entries = sorted(entry_points, key=lambda pair: pair[1])
-
-    # Process entry points
-    for x, t in sorted_entries:
-        if 0 <= t < length:  # Check if index is within bounds
-            result[t] = x
-
-    # If using forward fill
-    if fill_method == "ffill":
-        last_valid_value = None
-        for i in range(length):
-            if result[i] != 0:
-                last_valid_value = result[i]
-            elif last_valid_value is not None:
-                result[i] = last_valid_value
-
-    return result
-
-
 def plot_chronogram(
-    timesteps: list[float],
+    timesteps: np.ndarray,
     voltage_log: dict[str, list[tuple]],
-    spike_log: dict[str, list[float]],
+    spike_log: dict[str, array],
 ):
     print("Launching chronogram visualization...")
     print("=========================================")
     n = len(voltage_log.keys())
     _, ax = plt.subplots(nrows=n, ncols=1, sharex=True, figsize=(10, 5))
     values = [i / (n - 1) for i in range(n)]  # linearly spaced values between 0 and 1
-    colors = iter(cm.rainbow(values))
+    colors = cm.rainbow(values)
 
     for i, item in enumerate(voltage_log.keys()):
-        c = next(colors)
+        c = colors[i]
+        # Voltages are only sampled at the steps a neuron was visited; draw them at their own times
         v_log = voltage_log[item]
-        if len(timesteps) != len(v_log):
-            v_log = build_array(len(timesteps), v_log)
-        ax[i].plot(timesteps, v_log, c=c)
+        ax[i].plot(timesteps[[t for _, t in v_log]], [x for x, _ in v_log], c=c)
+        if len(timesteps):
+            ax[i].set_xlim(0, timesteps[-1])
         # Neuron names
         ax[i].set_ylabel(item, rotation=0, labelpad=30)
         # Voltage limits
@@ -67,9 +35,10 @@ def plot_chronogram(
         ax[i].spines["bottom"].set_visible(False)
         ax[i].spines["left"].set_visible(False)
 
-        if item in spike_log:
-            for spike in spike_log[item]:
-                ax[i].scatter(spike, 0, s=20, c=c)
+        # All spikes of a neuron drawn as a single collection
+        spikes = np.frombuffer(spike_log.get(item, array("d")), dtype=np.float64)
+        if len(spikes):
+            ax[i].scatter(spikes, np.zeros_like(spikes), s=20, color=c)
 
     plt.show()
     print("=========================================")
@@ -136,7 +136,10 @@ def format_groups(groups: list[tuple[ExplicitNeuron, str]]) -> list[dict[str, st
     return formatted_groups
 
 
-def vis_topology(net: SpikingNetworkModule) -> None:
+def build_graph_data(net: SpikingNetworkModule) -> dict[str, list]:
+    """
+    Build the JSON-serializable nodes, edges and groups rendered by the topology visualization.
+    """
     neurons_to_display, synapses_to_display = get_neurons_and_synapses_to_display(net)
     groups_to_display = get_groups_to_display(net, neurons_to_display)
 
@@ -148,5 +151,8 @@ def vis_topology(net: SpikingNetworkModule) -> None:
     graph_data["nodes"] = nodes
     graph_data["edges"] = edges
     graph_data["groups"] = groups
+    return graph_data
 
-    start_server(graph_data)
+
+def vis_topology(net: SpikingNetworkModule) -> None:
+    start_server(build_graph_data(net))
@@ -0,0 +1,102 @@
+import pytest
+from axon_sdk.primitives import ExplicitNeuron
+from axon_sdk.primitives.events import (
+    SpikeEventQueue,
+    SpikePredictionQueue,
+    time_to_step,
+)
+
+
+def _neuron(name):
+    return ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0, neuron_name=name)
+
+
+def test_event_queue_pops_in_time_then_insertion_order():
+    queue = SpikeEventQueue(dt=0.5)
+    a, b, c = _neuron("a"), _neuron("b"), _neuron("c")
+    queue.add_event(time=2.0, neuron=a, synapse_type="V", weight=1.0)
+    queue.add_event(time=1.0, neuron=b, synapse_type="V", weight=1.0)
+    queue.add_event(time=1.0, neuron=c, synapse_type="V", weight=1.0)
+
+    assert queue.peek_time() == 1.0
+    assert queue.peek_step() == 1
+    assert [e.affected_neuron for e in queue.pop_step(1)] == [b, c]
+    assert len(queue) == 1
+    assert [e.affected_neuron for e in queue.pop_events(5.0)] == [a]
+
+
+def test_prediction_queue_skips_cancelled_and_replaced():
+    queue = SpikePredictionQueue()
+    a, b, c = _neuron("a"), _neuron("b"), _neuron("c")
+    queue.schedule(a, 5)
+    queue.schedule(b, 3)
+    queue.schedule(c, 4)
+    queue.cancel(b)
+    queue.schedule(a, 4)
+
+    assert len(queue) == 2
+    assert queue.peek_step() == 4
+    assert queue.pop_due(4) == [c, a]
+    assert len(queue) == 0
+    assert queue.pop_due(10) == []
+
+
+def test_prediction_queue_compacts_tombstones():
+    queue = SpikePredictionQueue()
+    neuron = _neuron("a")
+    for step in range(10 * SpikePredictionQueue.MIN_COMPACTION_SIZE):
+        queue.schedule(neuron, step)
+
+    assert len(queue._heap) <= SpikePredictionQueue.MIN_COMPACTION_SIZE + 1
+    assert queue.pop_due(10**6) == [neuron]
+
+    with pytest.raises(IndexError):
+        queue.peek_step()
+
+
+def test_event_queue_delay_buckets_keep_global_order():
+    queue = SpikeEventQueue()
+    neurons = [_neuron(f"n{i}") for i in range(6)]
+    queue.add_event(time=3.0, neuron=neurons[0], synapse_type="V", weight=1.0, delay=2.0)
+    queue.add_event(time=1.5, neuron=neurons[1], synapse_type="V", weight=1.0, delay=0.5)
+    queue.add_event(time=5.0, neuron=neurons[2], synapse_type="V", weight=1.0, delay=2.0)
+    # Out of order for its bucket: goes to the fallback heap
+    queue.add_event(time=2.0, neuron=neurons[3], synapse_type="V", weight=1.0, delay=2.0)
+    queue.add_event(time=3.0, neuron=neurons[4], synapse_type="V", weight=1.0)
+    queue.add_event(time=1.5, neuron=neurons[5], synapse_type="V", weight=1.0, delay=0.5)
+
+    assert len(queue) == 6
+    assert queue.peek_time() == 1.5
+    popped = [e.affected_neuron for e in queue.pop_events(3.0)]
+    assert popped == [neurons[1], neurons[5], neurons[3], neurons[0], neurons[4]]
+    assert queue.peek_time() == 5.0
+    assert [e.affected_neuron for e in queue.pop_events(10.0)] == [neurons[2]]
+    assert len(queue) == 0
+
+
+@pytest.mark.parametrize("with_delays", [False, True])
+def test_add_events_matches_add_event(with_delays):
+    neurons = [_neuron(f"n{i}") for i in range(5)]
+    times = [4.0, 1.0, 3.0, 1.0, 2.0]
+    delays = [1.0, 1.0, 2.0, 1.0, 2.0] if with_delays else [None] * 5
+
+    single = SpikeEventQueue()
+    for time, neuron, delay in zip(times, neurons, delays):
+        single.add_event(time, neuron, "ge", 0.5, delay=delay)
+    batched = SpikeEventQueue()
+    batched.add_events(
+        times, neurons, ["ge"] * 5, [0.5] * 5, delays=delays if with_delays else None
+    )
+
+    assert len(batched) == len(single) == 5
+    expected = [e.affected_neuron for e in single.pop_events(10.0)]
+    assert [e.affected_neuron for e in batched.pop_events(10.0)] == expected
+
+
+@pytest.mark.parametrize("dt", [0.001, 0.01, 0.1, 0.3])
+def test_time_to_step_matches_end_of_step_comparison(dt):
+    for i in range(2000):
+        time = i * 0.0137 + (i % 3) * dt
+        step = time_to_step(time, dt)
+        assert (step + 1) * dt >= time
+        assert step == 0 or step * dt < time
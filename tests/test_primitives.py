@@ -1,5 +1,10 @@
 import pytest
 from axon_sdk.primitives import SpikingNetworkModule, ExplicitNeuron
+from axon_sdk.primitives.elements import (
+    Synapse,
+    predict_spike_steps,
+    BATCH_PREDICTION_MIN_SIZE,
+)
 
 
 def test_basic_module():
@@ -57,3 +62,87 @@ def test_deeper_module():
 
     assert len(module.neurons) == 3, "module.neurons should contain 3 neurons"
     assert isinstance(module.neurons, list), "module.neurons should be a list"
+
+
+def test_synapse_arrays_follow_out_synapses():
+    module = SpikingNetworkModule()
+    pre = module.add_neuron(Vt=10, tm=100, tf=20, neuron_name="pre")
+    post1 = module.add_neuron(Vt=10, tm=100, tf=20, neuron_name="post1")
+    post2 = module.add_neuron(Vt=10, tm=100, tf=20, neuron_name="post2")
+
+    assert pre.syn_post == ()
+    module.connect_neurons(pre, post1, "ge", weight=2.0, delay=1.0)
+    module.connect_neurons(pre, post2, "V", weight=-3.0, delay=0.5)
+
+    assert pre.syn_post == (post1, post2)
+    assert pre.syn_type == ("ge", "V")
+    assert pre.syn_weight == (2.0, -3.0)
+    assert pre.syn_delay == (1.0, 0.5)
+    assert post1.syn_post == ()
+
+    # Synapses appended directly are picked up without an explicit finalize
+    pre.out_synapses.append(Synapse(pre, post1, weight=1.0, delay=2.0, synapse_type="gate"))
+    assert pre.syn_post == (post1, post2, post1)
+    assert pre.synapse_arrays()[2] == ("ge", "V", "gate")
+
+
+def _stepwise_spike(neuron: ExplicitNeuron, dt: float, max_steps: int):
+    for n in range(1, max_steps + 1):
+        _, spike = neuron.update_and_spike(dt)
+        if spike:
+            return n
+    return None
+
+
+@pytest.mark.parametrize(
+    "ge, gf, gate",
+    [
+        (0.1, 0.0, 0),
+        (-0.1, 0.0, 0),
+        (0.0, 50.0, 1),
+        (0.2, 50.0, 1),
+        (-0.05, 80.0, 1),
+        (0.05, -20.0, 1),
+        (0.0, 30.0, 0),
+        (0.1, 0.0, 1),
+    ],
+)
+def test_closed_form_matches_stepwise_integration(ge, gf, gate):
+    dt = 0.01
+    max_steps = 20000
+
+    def make_neuron():
+        neuron = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0, neuron_name="probe")
+        neuron.ge, neuron.gf, neuron.gate = ge, gf, gate
+        return neuron
+
+    predicted = make_neuron().steps_to_spike(dt, max_steps)
+    expected = _stepwise_spike(make_neuron(), dt, max_steps)
+    assert predicted == expected
+
+    stepped = make_neuron()
+    for _ in range(500):
+        stepped.update_and_spike(dt)
+    advanced = make_neuron()
+    advanced.advance(500, dt)
+    if gate and gf:
+        assert advanced.V == pytest.approx(stepped.V)
+        assert advanced.gf == pytest.approx(stepped.gf)
+    else:
+        assert advanced.V == stepped.V
+
+
+def test_batch_prediction_matches_scalar():
+    neurons = []
+    for i in range(BATCH_PREDICTION_MIN_SIZE + 8):
+        neuron = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0, neuron_name=f"probe{i}")
+        neuron.V = (i % 7) - 2.0
+        neuron.ge = ((i % 5) - 2) * 0.05
+        neuron.gf = ((i % 3) - 1) * 60.0
+        neuron.gate = i % 2
+        neurons.append(neuron)
+
+    batched = predict_spike_steps(neurons, dt=0.01, max_steps=20000)
+    scalar = [neuron.steps_to_spike(0.01, 20000) for neuron in neurons]
+    assert batched == scalar
+    assert any(n is not None for n in batched)
@@ -0,0 +1,24 @@
+from axon_sdk.networks import MemoryNetwork
+from axon_sdk.primitives import DataEncoder, ExplicitNeuron
+from axon_sdk import Simulator
+
+
+def test_logs_are_persistent_and_shared():
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MemoryNetwork(encoder)
+    sim = Simulator(net, encoder, dt=0.01)
+
+    spike_log = sim.spike_log
+    assert set(spike_log) == {neuron.uid for neuron in net.neurons}
+
+    # A neuron outside the network is registered on its first record
+    outside = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0, neuron_name="outside")
+    sim.apply_input_spike(outside, t=1.0)
+    sim.apply_input_value(0.5, net.input)
+    sim.apply_input_spike(net.recall, t=200)
+    sim.simulate(simulation_time=400)
+
+    assert sim.spike_log is spike_log
+    assert list(spike_log[outside.uid]) == [1.0]
+    assert len(spike_log[net.output.uid]) == 2
+    assert sim.voltage_log[net.output.uid] is sim._voltages[net.output]
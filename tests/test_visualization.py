@@ -0,0 +1,32 @@
+import numpy as np
+from axon_sdk.networks import MemoryNetwork
+from axon_sdk.primitives import DataEncoder, ExplicitNeuron
+from axon_sdk import Simulator
+from axon_sdk.visualization.artifact import load_artifact
+
+
+def test_artifact_roundtrip(tmp_path):
+    encoder = DataEncoder(Tmin=10.0, Tcod=100.0)
+    net = MemoryNetwork(encoder)
+    sim = Simulator(net, encoder, dt=0.01)
+    # Input neuron outside the network: it only appears in the spike log
+    source = ExplicitNeuron(Vt=10.0, tm=100.0, tf=20.0, neuron_name="source")
+    sim.apply_input_spike(source, t=1.0)
+    sim.apply_input_value(0.5, net.input)
+    sim.apply_input_spike(net.recall, t=200)
+    sim.simulate(simulation_time=400)
+
+    path = tmp_path / "vis.npz"
+    sim._dump_viz_artifact(str(path))
+    timesteps, voltage_log, spike_log, graph_data = load_artifact(str(path))
+
+    assert np.array_equal(timesteps, sim.timesteps)
+    assert spike_log == sim.spike_log
+    assert voltage_log.keys() == sim.spike_log.keys()
+    assert voltage_log[source.uid] == []
+    for uid, samples in sim.voltage_log.items():
+        assert [step for _, step in voltage_log[uid]] == [step for _, step in samples]
+        assert np.allclose(
+            [V for V, _ in voltage_log[uid]], [V for V, _ in samples], atol=1e-4
+        )
+    assert len(graph_data["nodes"]) == len(net.neurons)